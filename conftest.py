@@ -53,6 +53,10 @@ def pytest_configure(config):
     config.addinivalue_line("markers", "lazy_import")
     config.addinivalue_line("markers", "notrackingurimock")
     config.addinivalue_line("markers", "allow_infer_pip_requirements_fallback")
+    # Registered by pytest-xdist >= 2.5 and pytest-forked when they're installed; also register
+    # them here so that tests using them can run without these plugins
+    config.addinivalue_line("markers", "xdist_group")
+    config.addinivalue_line("markers", "forked")
 
 
 def pytest_runtest_setup(item):
@@ -1,26 +1,53 @@
 # pep8: disable=E501
 
 import collections
+import functools
+import importlib
+import inspect
+import io
+import os
 import pytest
 import sys
 import pickle
 from packaging.version import Version
 
+# None of the tests in this module use GPUs. Hide them from TensorFlow (unless explicitly
+# configured otherwise) before it is imported to avoid CUDA device initialization overhead, and
+# silence TensorFlow's C++ logging
+os.environ.setdefault("CUDA_VISIBLE_DEVICES", "")
+os.environ.setdefault("TF_CPP_MIN_LOG_LEVEL", "3")
+
 import numpy as np
 import pandas as pd
-import tensorflow as tf
+
+tf = pytest.importorskip("tensorflow")
 from tensorflow.keras import layers
 
 import mlflow
 import mlflow.tensorflow
 from mlflow.tensorflow._autolog import _TensorBoard, __MLflowTfKeras2Callback
 import mlflow.keras
-from mlflow.utils.autologging_utils import BatchMetricsLogger, autologging_is_disabled
-from unittest.mock import patch
+from mlflow.utils.autologging_utils import (
+    AUTOLOGGING_INTEGRATIONS,
+    BatchMetricsLogger,
+    autologging_is_disabled,
+)
 
-import os
+try:
+    tf.config.experimental.set_visible_devices([], "GPU")
+except RuntimeError:
+    # Visible devices can't be modified once the TensorFlow runtime has been initialized (e.g., by
+    # tests in another module that ran earlier in the same process)
+    pass
+
+_TF_VER = Version(tf.__version__)
+_TF_GE_2_1 = _TF_VER >= Version("2.1.0")
+_TF_GE_2_3 = _TF_VER >= Version("2.3.0")
+_TF_GE_2_6 = _TF_VER >= Version("2.6.0")
 
-np.random.seed(1337)
+# Number of training epochs for test cases that only verify run lifecycle / artifact behavior and
+# make no assertions about per-epoch metrics or the number of training epochs
+MIN_EPOCHS_STRUCTURAL = 2
 
 SavedModelInfo = collections.namedtuple(
     "SavedModelInfo",
@@ -28,24 +55,65 @@ SavedModelInfo = collections.namedtuple(
 )
 
 
+# The number of `tf.keras` models constructed by test cases since the last call to
+# `tf.keras.backend.clear_session()`
+_num_keras_models_since_clear = 0
+
+
+def _record_keras_model_creation():
+    global _num_keras_models_since_clear
+    _num_keras_models_since_clear += 1
+
+
 @pytest.fixture(autouse=True)
 def clear_session():
+    """
+    Clears the Keras global state after each test case that constructed a `tf.keras` model.
+    Test cases that don't construct any Keras models (e.g., `tf.estimator` tests) leave the global
+    state untouched, so test cases must not assume that the Keras session is fresh.
+    """
+    global _num_keras_models_since_clear
     yield
-    tf.keras.backend.clear_session()
+    if _num_keras_models_since_clear > 0:
+        tf.keras.backend.clear_session()
+        _num_keras_models_since_clear = 0
 
 
-@pytest.fixture
+# The training data is only used as read-only model input, so it is generated deterministically
+# at import time and shared by all test cases. Because the data is derived from a fixed seed,
+# every process (e.g., each pytest-xdist worker) computes bitwise-identical arrays without any
+# cross-process data sharing. A handful of float32 samples (a single training batch) is sufficient
+# for the logging assertions in this module, and float32 matches the model's input dtype so that
+# Keras doesn't need to cast the data on every `fit()` call
+_rng = np.random.default_rng(1337)
+_X = np.ascontiguousarray(_rng.standard_normal((4, 4), dtype=np.float32))
+_Y = np.eye(3, dtype=np.float32)[_rng.integers(0, 3, len(_X))]
+
+
+@pytest.fixture(scope="session")
 def random_train_data():
-    return np.random.random((150, 4))
+    return _X
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def random_one_hot_labels():
-    n, n_class = (150, 3)
-    classes = np.random.randint(0, n_class, n)
-    labels = np.zeros((n, n_class))
-    labels[np.arange(n), classes] = 1
-    return labels
+    return _Y
+
+
+@pytest.fixture(scope="session")
+def random_train_dataset(random_train_data, random_one_hot_labels):
+    """
+    A cached, prefetched `tf.data` pipeline over the random training data for `fit()` calls that
+    specify `steps_per_epoch`. The dataset is repeated indefinitely because Keras does not recreate
+    the dataset iterator between epochs in all TensorFlow versions when `steps_per_epoch` is set.
+    """
+    return (
+        tf.data.Dataset.from_tensor_slices((random_train_data, random_one_hot_labels))
+        .batch(len(random_train_data))
+        .cache()
+        .repeat()
+        .prefetch(tf.data.experimental.AUTOTUNE)
+    )
 
 
 @pytest.fixture
@@ -55,6 +123,14 @@ def clear_tf_keras_imports():
     libraries from the `sys.modules` dictionary. This is useful for testing the interaction
     between TensorFlow / Keras and the fluent `mlflow.autolog()` API because it will cause import
     hooks to be re-triggered upon re-import after `mlflow.autolog()` is enabled.
+    Test cases that use this fixture should be marked with
+    `@pytest.mark.xdist_group(name="tf_keras_imports")` so that, when running with
+    `pytest-xdist --dist=loadgroup`, they execute on a single worker and the module state
+    produced by re-importing TensorFlow / Keras is confined to that worker process. Test cases
+    that only import modules (i.e. don't execute TensorFlow operations, which isn't safe after
+    forking a process with an initialized TensorFlow runtime) should additionally be marked with
+    `@pytest.mark.forked` so that, when `pytest-forked` is installed, the re-imported module
+    state never reaches the parent test process.
     """
     sys.modules.pop("tensorflow", None)
     sys.modules.pop("keras", None)
@@ -71,27 +147,77 @@ def clear_fluent_autologging_import_hooks():
     mlflow.utils.import_hooks._post_import_hooks.pop("keras", None)
 
 
-def create_tf_keras_model():
+def _enable_tf_autologging(**kwargs):
+    """
+    Enables TensorFlow autologging with the specified configuration. If autologging is already
+    enabled with an identical configuration (e.g., by a previous test case), the call to
+    `mlflow.tensorflow.autolog()` is skipped to avoid needlessly reverting and reapplying its
+    patches to TensorFlow APIs.
+    """
+    config = {
+        name: param.default
+        for name, param in inspect.signature(mlflow.tensorflow.autolog).parameters.items()
+    }
+    config.update(kwargs)
+    if AUTOLOGGING_INTEGRATIONS.get(mlflow.tensorflow.FLAVOR_NAME) != config:
+        mlflow.tensorflow.autolog(**kwargs)
+
+
+def _get_latest_run(client):
+    """
+    Fetches the most recently started run in the default experiment, including its data, via a
+    single `search_runs()` call
+    """
+    return client.search_runs(
+        experiment_ids=["0"], max_results=1, order_by=["attributes.start_time DESC"]
+    )[0]
+
+
+def _get_artifact_paths(client, run_id):
+    return {artifact.path for artifact in client.list_artifacts(run_id)}
+
+
+@functools.lru_cache(maxsize=None)
+def _get_tf_keras_prototype_model():
+    """
+    Builds the uncompiled `tf.keras` model architecture used throughout this module once per
+    session. Test cases receive clones of this prototype (see `create_tf_keras_model()`), so it
+    is never trained or compiled directly and is unaffected by `clear_session()`.
+    """
     model = tf.keras.Sequential()
 
     model.add(layers.Dense(16, activation="relu", input_shape=(4,)))
     model.add(layers.Dense(3, activation="softmax"))
 
+    return model
+
+
+def create_tf_keras_model(run_eagerly=False):
+    # `clone_model()` creates fresh layers (with newly-initialized weights) from the prototype's
+    # layer configurations, so each test case still trains an independent model
+    model = tf.keras.models.clone_model(_get_tf_keras_prototype_model())
+    _record_keras_model_creation()
     model.compile(
-        optimizer=tf.keras.optimizers.Adam(), loss="categorical_crossentropy", metrics=["accuracy"]
+        optimizer=tf.keras.optimizers.Adam(),
+        loss="categorical_crossentropy",
+        metrics=["accuracy"],
+        # Train in graph mode by default; none of the tests in this module depend on eager
+        # execution semantics. Tests that only fit for a single step can pass `run_eagerly=True`
+        # to skip tracing the train function, which costs more than the step itself
+        run_eagerly=run_eagerly,
     )
     return model
 
 
 @pytest.mark.large
 def test_tf_keras_autolog_ends_auto_created_run(random_train_data, random_one_hot_labels):
-    mlflow.tensorflow.autolog()
+    _enable_tf_autologging()
 
     data = random_train_data
     labels = random_one_hot_labels
 
     model = create_tf_keras_model()
-    model.fit(data, labels, epochs=10)
+    model.fit(data, labels, epochs=MIN_EPOCHS_STRUCTURAL)
 
     assert mlflow.active_run() is None
 
@@ -102,51 +228,50 @@ def test_tf_keras_autolog_log_models_configuration(
     random_train_data, random_one_hot_labels, log_models
 ):
     # pylint: disable=unused-argument
-    mlflow.tensorflow.autolog(log_models=log_models)
+    _enable_tf_autologging(log_models=log_models)
 
     data = random_train_data
     labels = random_one_hot_labels
 
     model = create_tf_keras_model()
 
-    model.fit(data, labels, epochs=10)
+    model.fit(data, labels, epochs=MIN_EPOCHS_STRUCTURAL)
 
     client = mlflow.tracking.MlflowClient()
     run_id = client.list_run_infos(experiment_id="0")[0].run_id
-    artifacts = client.list_artifacts(run_id)
-    artifacts = map(lambda x: x.path, artifacts)
+    artifacts = _get_artifact_paths(client, run_id)
     assert ("model" in artifacts) == log_models
 
 
 @pytest.mark.large
 def test_tf_keras_autolog_persists_manually_created_run(random_train_data, random_one_hot_labels):
-    mlflow.tensorflow.autolog()
+    _enable_tf_autologging()
     with mlflow.start_run() as run:
         data = random_train_data
         labels = random_one_hot_labels
 
         model = create_tf_keras_model()
-        model.fit(data, labels, epochs=10)
+        model.fit(data, labels, epochs=MIN_EPOCHS_STRUCTURAL)
 
         assert mlflow.active_run()
         assert mlflow.active_run().info.run_id == run.info.run_id
 
 
 @pytest.fixture
-def tf_keras_random_data_run(random_train_data, random_one_hot_labels, initial_epoch):
+def tf_keras_random_data_run(random_train_dataset, initial_epoch):
     # pylint: disable=unused-argument
-    mlflow.tensorflow.autolog()
-
-    data = random_train_data
-    labels = random_one_hot_labels
+    _enable_tf_autologging()
 
     model = create_tf_keras_model()
     history = model.fit(
-        data, labels, epochs=initial_epoch + 10, steps_per_epoch=1, initial_epoch=initial_epoch
+        random_train_dataset,
+        epochs=initial_epoch + 10,
+        steps_per_epoch=1,
+        initial_epoch=initial_epoch,
     )
 
     client = mlflow.tracking.MlflowClient()
-    return client.get_run(client.list_run_infos(experiment_id="0")[0].run_id), history
+    return _get_latest_run(client), history
 
 
 @pytest.mark.large
@@ -181,8 +306,7 @@ def test_tf_keras_autolog_logs_expected_data(tf_keras_random_data_run):
     all_epoch_acc = client.get_metric_history(run.info.run_id, "accuracy")
     num_of_epochs = len(history.history["loss"])
     assert len(all_epoch_acc) == num_of_epochs == 10
-    artifacts = client.list_artifacts(run.info.run_id)
-    artifacts = map(lambda x: x.path, artifacts)
+    artifacts = _get_artifact_paths(client, run.info.run_id)
     assert "model_summary.txt" in artifacts
 
 
@@ -190,7 +314,7 @@ def test_tf_keras_autolog_logs_expected_data(tf_keras_random_data_run):
 def test_tf_keras_autolog_records_metrics_for_last_epoch(random_train_data, random_one_hot_labels):
     every_n_iter = 5
     num_training_epochs = 17
-    mlflow.tensorflow.autolog(every_n_iter=every_n_iter)
+    _enable_tf_autologging(every_n_iter=every_n_iter)
 
     model = create_tf_keras_model()
     with mlflow.start_run() as run:
@@ -219,7 +343,7 @@ def test_tf_keras_autolog_logs_metrics_for_single_epoch_training(
     produced in the boundary case where a model is trained for a single epoch, ensuring
     that we don't miss the zero index in the tf.Keras case.
     """
-    mlflow.tensorflow.autolog(every_n_iter=5)
+    _enable_tf_autologging(every_n_iter=5)
 
     model = create_tf_keras_model()
     with mlflow.start_run() as run:
@@ -235,7 +359,7 @@ def test_tf_keras_autolog_logs_metrics_for_single_epoch_training(
 def test_tf_keras_autolog_names_positional_parameters_correctly(
     random_train_data, random_one_hot_labels
 ):
-    mlflow.tensorflow.autolog(every_n_iter=5)
+    _enable_tf_autologging(every_n_iter=5)
 
     data = random_train_data
     labels = random_one_hot_labels
@@ -244,7 +368,7 @@ def test_tf_keras_autolog_names_positional_parameters_correctly(
 
     with mlflow.start_run():
         # Pass `batch_size` as a positional argument for testing purposes
-        model.fit(data, labels, 8, epochs=10, steps_per_epoch=1)
+        model.fit(data, labels, 8, epochs=MIN_EPOCHS_STRUCTURAL, steps_per_epoch=1)
         run_id = mlflow.active_run().info.run_id
 
     client = mlflow.tracking.MlflowClient()
@@ -253,20 +377,21 @@ def test_tf_keras_autolog_names_positional_parameters_correctly(
 
 
 @pytest.mark.large
-@pytest.mark.parametrize("initial_epoch", [0, 10])
+# The initial epoch doesn't affect the logged model, so a single training session suffices
+@pytest.mark.parametrize("initial_epoch", [0])
 def test_tf_keras_autolog_model_can_load_from_artifact(tf_keras_random_data_run, random_train_data):
     run, _ = tf_keras_random_data_run
 
     client = mlflow.tracking.MlflowClient()
-    artifacts = client.list_artifacts(run.info.run_id)
-    artifacts = map(lambda x: x.path, artifacts)
+    artifacts = _get_artifact_paths(client, run.info.run_id)
     assert "model" in artifacts
     assert "tensorboard_logs" in artifacts
     model = mlflow.keras.load_model("runs:/" + run.info.run_id + "/model")
     model.predict(random_train_data)
 
 
-def get_tf_keras_random_data_run_with_callback(
+@pytest.fixture
+def tf_keras_random_data_run_with_callback(
     random_train_data,
     random_one_hot_labels,
     callback,
@@ -275,7 +400,7 @@ def get_tf_keras_random_data_run_with_callback(
     initial_epoch,
 ):
     # pylint: disable=unused-argument
-    mlflow.tensorflow.autolog(every_n_iter=1)
+    _enable_tf_autologging(every_n_iter=1)
 
     data = random_train_data
     labels = random_one_hot_labels
@@ -303,26 +428,27 @@ def get_tf_keras_random_data_run_with_callback(
     )
 
     client = mlflow.tracking.MlflowClient()
-    return client.get_run(client.list_run_infos(experiment_id="0")[0].run_id), history, callback
+    return _get_latest_run(client), history, callback
 
 
 @pytest.fixture
-def tf_keras_random_data_run_with_callback(
-    random_train_data,
-    random_one_hot_labels,
-    callback,
-    restore_weights,
-    patience,
-    initial_epoch,
-):
-    return get_tf_keras_random_data_run_with_callback(
-        random_train_data,
-        random_one_hot_labels,
-        callback,
-        restore_weights,
-        patience,
-        initial_epoch,
+def recorded_batch_metrics(monkeypatch):
+    """
+    Replaces BatchMetricsLogger with a subclass that records the metrics passed to
+    `record_metrics()`, returning a dictionary of the most recently recorded value for each
+    metric. Subclassing avoids the per-call signature binding overhead of an autospecced mock.
+    """
+    patched_metrics_data = {}
+
+    class RecordingBatchMetricsLogger(BatchMetricsLogger):
+        def record_metrics(self, metrics, step=None):
+            patched_metrics_data.update(metrics)
+            super().record_metrics(metrics, step)
+
+    monkeypatch.setattr(
+        "mlflow.utils.autologging_utils.BatchMetricsLogger", RecordingBatchMetricsLogger
     )
+    return patched_metrics_data
 
 
 @pytest.mark.large
@@ -365,37 +491,14 @@ def test_tf_keras_autolog_early_stop_logs(tf_keras_random_data_run_with_callback
 @pytest.mark.parametrize("patience", [0, 1, 5])
 @pytest.mark.parametrize("initial_epoch", [0, 10])
 def test_tf_keras_autolog_batch_metrics_logger_logs_expected_metrics(
-    callback,
-    restore_weights,
-    patience,
+    # NB: `recorded_batch_metrics` must be requested before `tf_keras_random_data_run_with_callback`
+    # so that BatchMetricsLogger is patched before the model is trained
+    recorded_batch_metrics,
+    tf_keras_random_data_run_with_callback,
     initial_epoch,
-    random_train_data,
-    random_one_hot_labels,
 ):
-    patched_metrics_data = []
-
-    # Mock patching BatchMetricsLogger.record_metrics()
-    # to ensure that expected metrics are being logged.
-    original = BatchMetricsLogger.record_metrics
-
-    with patch(
-        "mlflow.utils.autologging_utils.BatchMetricsLogger.record_metrics", autospec=True
-    ) as record_metrics_mock:
-
-        def record_metrics_side_effect(self, metrics, step=None):
-            patched_metrics_data.extend(metrics.items())
-            original(self, metrics, step)
-
-        record_metrics_mock.side_effect = record_metrics_side_effect
-        run, _, callback = get_tf_keras_random_data_run_with_callback(
-            random_train_data,
-            random_one_hot_labels,
-            callback,
-            restore_weights,
-            patience,
-            initial_epoch,
-        )
-    patched_metrics_data = dict(patched_metrics_data)
+    run, _, _ = tf_keras_random_data_run_with_callback
+    patched_metrics_data = recorded_batch_metrics
     original_metrics = run.data.metrics
 
     for metric_name in original_metrics:
@@ -491,7 +594,7 @@ def test_tf_keras_autolog_does_not_mutate_original_callbacks_list(
     user-specified ones. This test verifies that the new callbacks are added to the without
     permanently mutating the original list of callbacks.
     """
-    mlflow.tensorflow.autolog()
+    _enable_tf_autologging()
 
     tensorboard_callback = tf.keras.callbacks.TensorBoard(log_dir=tmpdir)
     callbacks = [tensorboard_callback]
@@ -501,9 +604,9 @@ def test_tf_keras_autolog_does_not_mutate_original_callbacks_list(
     labels = random_one_hot_labels
 
     if positional:
-        model.fit(data, labels, None, 10, 1, callbacks)
+        model.fit(data, labels, None, MIN_EPOCHS_STRUCTURAL, 1, callbacks)
     else:
-        model.fit(data, labels, epochs=10, callbacks=callbacks)
+        model.fit(data, labels, epochs=MIN_EPOCHS_STRUCTURAL, callbacks=callbacks)
 
     assert len(callbacks) == 1
     assert callbacks == [tensorboard_callback]
@@ -518,13 +621,13 @@ def test_tf_keras_autolog_does_not_delete_logging_directory_for_tensorboard_call
         tensorboard_callback_logging_dir_path, histogram_freq=0
     )
 
-    mlflow.tensorflow.autolog()
+    _enable_tf_autologging()
 
     data = random_train_data
     labels = random_one_hot_labels
 
     model = create_tf_keras_model()
-    model.fit(data, labels, epochs=10, callbacks=[tensorboard_callback])
+    model.fit(data, labels, epochs=MIN_EPOCHS_STRUCTURAL, callbacks=[tensorboard_callback])
 
     assert os.path.exists(tensorboard_callback_logging_dir_path)
 
@@ -536,7 +639,7 @@ def test_tf_keras_autolog_logs_to_and_deletes_temporary_directory_when_tensorboa
     from unittest import mock
     from mlflow.tensorflow import _TensorBoardLogDir
 
-    mlflow.tensorflow.autolog()
+    _enable_tf_autologging()
 
     mock_log_dir_inst = _TensorBoardLogDir(location=str(tmpdir.mkdir("tb_logging")), is_temp=True)
     with mock.patch("mlflow.tensorflow._TensorBoardLogDir", autospec=True) as mock_log_dir_class:
@@ -546,21 +649,48 @@ def test_tf_keras_autolog_logs_to_and_deletes_temporary_directory_when_tensorboa
         labels = random_one_hot_labels
 
         model = create_tf_keras_model()
-        model.fit(data, labels, epochs=10)
+        model.fit(data, labels, epochs=MIN_EPOCHS_STRUCTURAL)
 
         assert not os.path.exists(mock_log_dir_inst.location)
 
 
-def create_tf_estimator_model(directory, export, training_steps=100, use_v1_estimator=False):
-    CSV_COLUMN_NAMES = ["SepalLength", "SepalWidth", "PetalLength", "PetalWidth", "Species"]
+_IRIS_CSV_COLUMN_NAMES = ["SepalLength", "SepalWidth", "PetalLength", "PetalWidth", "Species"]
+
 
+@functools.lru_cache(maxsize=1)
+def _load_iris_training_data():
+    """
+    Loads the Iris training features and labels once per session. The returned objects are shared
+    across test cases and must not be mutated.
+    """
     train = pd.read_csv(
         os.path.join(os.path.dirname(__file__), "iris_training.csv"),
-        names=CSV_COLUMN_NAMES,
+        names=_IRIS_CSV_COLUMN_NAMES,
         header=0,
     )
-
     train_y = train.pop("Species")
+    return train, train_y
+
+
+@functools.lru_cache(maxsize=1)
+def _get_iris_feature_columns():
+    train, _ = _load_iris_training_data()
+    return [tf.feature_column.numeric_column(key=key) for key in train.keys()]
+
+
+@functools.lru_cache(maxsize=1)
+def _get_iris_serving_input_receiver_fn():
+    feature_spec = {}
+    for feature in _IRIS_CSV_COLUMN_NAMES:
+        feature_spec[feature] = tf.Variable([], dtype=tf.float64, name=feature)
+
+    return tf.estimator.export.build_raw_serving_input_receiver_fn(feature_spec)
+
+
+def create_tf_estimator_model(
+    directory, export, training_steps=100, use_v1_estimator=False, save_summary_steps=50
+):
+    train, train_y = _load_iris_training_data()
 
     def input_fn(features, labels, training=True, batch_size=256):
         """An input function for training or evaluating"""
@@ -573,28 +703,20 @@ def create_tf_estimator_model(directory, export, training_steps=100, use_v1_esti
 
         return dataset.batch(batch_size)
 
-    my_feature_columns = []
-    for key in train.keys():
-        my_feature_columns.append(tf.feature_column.numeric_column(key=key))
-
-    feature_spec = {}
-    for feature in CSV_COLUMN_NAMES:
-        feature_spec[feature] = tf.Variable([], dtype=tf.float64, name=feature)
+    my_feature_columns = _get_iris_feature_columns()
+    receiver_fn = _get_iris_serving_input_receiver_fn()
 
-    receiver_fn = tf.estimator.export.build_raw_serving_input_receiver_fn(feature_spec)
-
-    run_config = tf.estimator.RunConfig(
-        # Emit loss metrics to TensorBoard every step
-        save_summary_steps=1,
-    )
+    # Autologging records estimator metrics from TensorBoard summaries, so tests that make
+    # assertions about logged metrics should emit summaries every step (`save_summary_steps=1`)
+    run_config = tf.estimator.RunConfig(save_summary_steps=save_summary_steps)
 
     # If flag set to true, then use the v1 classifier that extends Estimator
     # If flag set to false, then use the v2 classifier that extends EstimatorV2
     if use_v1_estimator:
         classifier = tf.compat.v1.estimator.DNNClassifier(
             feature_columns=my_feature_columns,
-            # Two hidden layers of 10 nodes each.
-            hidden_units=[30, 10],
+            # A single small hidden layer is sufficient for the autologging assertions
+            hidden_units=[4],
             # The model must choose between 3 classes.
             n_classes=3,
             model_dir=directory,
@@ -603,8 +725,8 @@ def create_tf_estimator_model(directory, export, training_steps=100, use_v1_esti
     else:
         classifier = tf.estimator.DNNClassifier(
             feature_columns=my_feature_columns,
-            # Two hidden layers of 10 nodes each.
-            hidden_units=[30, 10],
+            # A single small hidden layer is sufficient for the autologging assertions
+            hidden_units=[4],
             # The model must choose between 3 classes.
             n_classes=3,
             model_dir=directory,
@@ -620,7 +742,7 @@ def create_tf_estimator_model(directory, export, training_steps=100, use_v1_esti
 @pytest.mark.parametrize("export", [True, False])
 def test_tf_estimator_autolog_ends_auto_created_run(tmpdir, export):
     directory = tmpdir.mkdir("test")
-    mlflow.tensorflow.autolog()
+    _enable_tf_autologging()
     create_tf_estimator_model(str(directory), export)
     assert mlflow.active_run() is None
 
@@ -639,10 +761,11 @@ def test_tf_estimator_autolog_persists_manually_created_run(tmpdir, export):
 def tf_estimator_random_data_run(tmpdir, export):
     # pylint: disable=unused-argument
     directory = tmpdir.mkdir("test")
-    mlflow.tensorflow.autolog()
-    create_tf_estimator_model(str(directory), export)
+    _enable_tf_autologging()
+    # Emit summaries every step for `test_tf_estimator_autolog_logs_tensorboard_logs`
+    create_tf_estimator_model(str(directory), export, save_summary_steps=1)
     client = mlflow.tracking.MlflowClient()
-    return client.get_run(client.list_run_infos(experiment_id="0")[0].run_id)
+    return _get_latest_run(client)
 
 
 @pytest.mark.large
@@ -650,11 +773,15 @@ def tf_estimator_random_data_run(tmpdir, export):
 @pytest.mark.parametrize("use_v1_estimator", [True, False])
 def test_tf_estimator_autolog_logs_metrics(tmpdir, export, use_v1_estimator):
     directory = tmpdir.mkdir("test")
-    mlflow.tensorflow.autolog(every_n_iter=5)
+    _enable_tf_autologging(every_n_iter=5)
 
     with mlflow.start_run():
         create_tf_estimator_model(
-            str(directory), export, use_v1_estimator=use_v1_estimator, training_steps=17
+            str(directory),
+            export,
+            use_v1_estimator=use_v1_estimator,
+            training_steps=17,
+            save_summary_steps=1,
         )
         run_id = mlflow.active_run().info.run_id
 
@@ -671,13 +798,12 @@ def test_tf_estimator_autolog_logs_metrics(tmpdir, export, use_v1_estimator):
 @pytest.mark.parametrize("export", [True])
 def test_tf_estimator_v1_autolog_can_load_from_artifact(tmpdir, export):
     directory = tmpdir.mkdir("test")
-    mlflow.tensorflow.autolog()
+    _enable_tf_autologging()
 
     create_tf_estimator_model(str(directory), export, use_v1_estimator=True)
     client = mlflow.tracking.MlflowClient()
-    tf_estimator_v1_run = client.get_run(client.list_run_infos(experiment_id="0")[0].run_id)
-    artifacts = client.list_artifacts(tf_estimator_v1_run.info.run_id)
-    artifacts = map(lambda x: x.path, artifacts)
+    tf_estimator_v1_run = _get_latest_run(client)
+    artifacts = _get_artifact_paths(client, tf_estimator_v1_run.info.run_id)
     assert "model" in artifacts
     mlflow.tensorflow.load_model("runs:/" + tf_estimator_v1_run.info.run_id + "/model")
 
@@ -692,11 +818,11 @@ def test_tf_estimator_autolog_logs_tensorboard_logs(tf_estimator_random_data_run
 
 @pytest.mark.large
 def test_tf_estimator_autolog_logs_metrics_in_exclusive_mode(tmpdir):
-    mlflow.tensorflow.autolog(exclusive=True)
+    _enable_tf_autologging(exclusive=True)
 
-    create_tf_estimator_model(tmpdir, export=False)
+    create_tf_estimator_model(tmpdir, export=False, save_summary_steps=1)
     client = mlflow.tracking.MlflowClient()
-    tf_estimator_run = client.get_run(client.list_run_infos(experiment_id="0")[0].run_id)
+    tf_estimator_run = _get_latest_run(client)
 
     assert "loss" in tf_estimator_run.data.metrics
     assert "steps" in tf_estimator_run.data.params
@@ -713,9 +839,9 @@ def test_tf_estimator_autolog_logs_metics_for_single_epoch_training(tmpdir):
     in the boundary casewhere a model is trained for a single epoch, ensuring that
     we capture metrics from the first epoch at index 1.
     """
-    mlflow.tensorflow.autolog()
+    _enable_tf_autologging()
     with mlflow.start_run() as run:
-        create_tf_estimator_model(str(tmpdir), export=False, training_steps=1)
+        create_tf_estimator_model(str(tmpdir), export=False, training_steps=1, save_summary_steps=1)
     client = mlflow.tracking.MlflowClient()
     metrics = client.get_metric_history(run.info.run_id, "loss")
     assert len(metrics) == 1
@@ -726,8 +852,7 @@ def test_tf_estimator_autolog_logs_metics_for_single_epoch_training(tmpdir):
 @pytest.mark.parametrize("export", [True])
 def test_tf_estimator_autolog_model_can_load_from_artifact(tf_estimator_random_data_run):
     client = mlflow.tracking.MlflowClient()
-    artifacts = client.list_artifacts(tf_estimator_random_data_run.info.run_id)
-    artifacts = map(lambda x: x.path, artifacts)
+    artifacts = _get_artifact_paths(client, tf_estimator_random_data_run.info.run_id)
     assert "model" in artifacts
     mlflow.tensorflow.load_model("runs:/" + tf_estimator_random_data_run.info.run_id + "/model")
 
@@ -784,6 +909,7 @@ def get_text_vec_model(train_samples):
         output_sequence_length=SEQUENCE_LENGTH,
     )
     vectorizer_layer.adapt(train_samples)
+    _record_keras_model_creation()
     model = tf.keras.Sequential(
         [
             vectorizer_layer,
@@ -804,7 +930,7 @@ def get_text_vec_model(train_samples):
 
 
 @pytest.mark.skipif(
-    Version(tf.__version__) < Version("2.3.0"),
+    not _TF_GE_2_3,
     reason=(
         "Deserializing a model with `TextVectorization` and `Embedding`"
         "fails in tensorflow < 2.3.0. See this issue:"
@@ -815,7 +941,7 @@ def test_autolog_text_vec_model(tmpdir):
     """
     Verifies autolog successfully saves a model that can't be saved in the H5 format
     """
-    mlflow.tensorflow.autolog()
+    _enable_tf_autologging()
 
     train_samples = np.array(["this is an example", "another example"])
     train_labels = np.array([0.4, 0.2])
@@ -833,21 +959,21 @@ def test_autolog_text_vec_model(tmpdir):
 
 
 def test_fit_generator(random_train_data, random_one_hot_labels):
-    mlflow.tensorflow.autolog()
-    model = create_tf_keras_model()
+    _enable_tf_autologging(log_models=False)
+    model = create_tf_keras_model(run_eagerly=True)
 
     def generator():
         while True:
             yield random_train_data, random_one_hot_labels
 
     with mlflow.start_run() as run:
-        model.fit_generator(generator(), epochs=10, steps_per_epoch=1)
+        model.fit_generator(generator(), epochs=1, steps_per_epoch=1)
 
     run = mlflow.tracking.MlflowClient().get_run(run.info.run_id)
     params = run.data.params
     metrics = run.data.metrics
     assert "epochs" in params
-    assert params["epochs"] == "10"
+    assert params["epochs"] == "1"
     assert "steps_per_epoch" in params
     assert params["steps_per_epoch"] == "1"
     assert "accuracy" in metrics
@@ -856,6 +982,7 @@ def test_fit_generator(random_train_data, random_one_hot_labels):
 
 @pytest.mark.large
 @pytest.mark.usefixtures("clear_tf_keras_imports")
+@pytest.mark.xdist_group(name="tf_keras_imports")
 def test_fluent_autolog_with_tf_keras_logs_expected_content(
     random_train_data, random_one_hot_labels
 ):
@@ -866,42 +993,63 @@ def test_fluent_autolog_with_tf_keras_logs_expected_content(
     """
     mlflow.autolog()
 
-    model = create_tf_keras_model()
+    model = create_tf_keras_model(run_eagerly=True)
 
     with mlflow.start_run() as run:
-        model.fit(random_train_data, random_one_hot_labels, epochs=10)
+        model.fit(random_train_data, random_one_hot_labels, epochs=1)
 
     client = mlflow.tracking.MlflowClient()
     run_data = client.get_run(run.info.run_id).data
     assert "accuracy" in run_data.metrics
     assert "epochs" in run_data.params
 
-    artifacts = client.list_artifacts(run.info.run_id)
-    artifacts = map(lambda x: x.path, artifacts)
-    assert "model" in artifacts
+    artifact_paths = _get_artifact_paths(client, run.info.run_id)
+    assert "model" in artifact_paths
 
 
 def test_callback_is_picklable():
+    # Only verify that pickling succeeds; stream the (discarded) output to a reusable in-memory
+    # buffer rather than materializing the pickled bytes of each callback
+    sink = io.BytesIO()
+
     cb = __MLflowTfKeras2Callback(
         log_models=True, metrics_logger=BatchMetricsLogger(run_id="1234"), log_every_n_steps=5
     )
-    pickle.dumps(cb)
+    pickle.Pickler(sink, protocol=pickle.HIGHEST_PROTOCOL).dump(cb)
 
+    sink.seek(0)
+    sink.truncate()
     tb = _TensorBoard()
-    pickle.dumps(tb)
+    pickle.Pickler(sink, protocol=pickle.HIGHEST_PROTOCOL).dump(tb)
+
+
+@pytest.fixture(scope="module")
+def distribution_strategy():
+    """
+    Distribution strategy shared by the distributed training tests in this module. Constructing a
+    strategy discovers and configures devices, so it is only done once per module. Models are still
+    created per test under ``strategy.scope()``, since the autouse ``clear_session`` fixture
+    invalidates Keras models across tests.
+    """
+    # Mirroring variables across replicas adds significant setup overhead without exercising any
+    # additional autologging behavior on single-device machines, so only use `MirroredStrategy`
+    # when multiple GPUs are available
+    if len(tf.config.list_logical_devices("GPU")) >= 2:
+        return tf.distribute.MirroredStrategy()
+    return tf.distribute.OneDeviceStrategy("/cpu:0")
 
 
 @pytest.mark.large
-@pytest.mark.skipif(
-    Version(tf.__version__) < Version("2.1.0"), reason="This test requires tensorflow >= 2.1.0"
-)
-def test_tf_keras_autolog_distributed_training(random_train_data, random_one_hot_labels):
+@pytest.mark.skipif(not _TF_GE_2_1, reason="This test requires tensorflow >= 2.1.0")
+def test_tf_keras_autolog_distributed_training(
+    random_train_data, random_one_hot_labels, distribution_strategy
+):
     # Ref: https://www.tensorflow.org/tutorials/distribute/keras
-    mlflow.tensorflow.autolog()
+    _enable_tf_autologging(log_models=False)
 
-    with tf.distribute.MirroredStrategy().scope():
+    with distribution_strategy.scope():
         model = create_tf_keras_model()
-    fit_params = {"epochs": 10, "batch_size": 10}
+    fit_params = {"epochs": 1, "batch_size": 10}
     with mlflow.start_run() as run:
         model.fit(random_train_data, random_one_hot_labels, **fit_params)
     client = mlflow.tracking.MlflowClient()
@@ -910,10 +1058,12 @@ def test_tf_keras_autolog_distributed_training(random_train_data, random_one_hot
 
 @pytest.mark.large
 @pytest.mark.skipif(
-    Version(tf.__version__) < Version("2.6.0"),
+    not _TF_GE_2_6,
     reason=("TensorFlow only has a hard dependency on Keras in version >= 2.6.0"),
 )
 @pytest.mark.usefixtures("clear_tf_keras_imports")
+@pytest.mark.xdist_group(name="tf_keras_imports")
+@pytest.mark.forked
 def test_fluent_autolog_with_tf_keras_preserves_v2_model_reference():
     """
     Verifies that, in TensorFlow >= 2.6.0, `tensorflow.keras.Model` refers to the correct class in
@@ -929,48 +1079,42 @@ def test_fluent_autolog_with_tf_keras_preserves_v2_model_reference():
     assert tensorflow.keras.Model is ModelV2
 
 
+@pytest.mark.parametrize(
+    ("module_name", "explicitly_import_keras"),
+    [
+        ("tensorflow", True),
+        # NB: For TF >= 2.6, importing tensorflow.keras triggers importing keras
+        pytest.param("tensorflow.keras", False, marks=pytest.mark.large),
+        pytest.param(
+            "keras",
+            False,
+            marks=[
+                pytest.mark.large,
+                pytest.mark.skipif(
+                    not _TF_GE_2_6,
+                    reason=(
+                        "TensorFlow autologging is not used for vanilla Keras models in "
+                        "Keras < 2.6.0"
+                    ),
+                ),
+            ],
+        ),
+    ],
+)
 @pytest.mark.usefixtures("clear_tf_keras_imports")
-def test_import_tensorflow_with_fluent_autolog_enables_tf_autologging():
+@pytest.mark.xdist_group(name="tf_keras_imports")
+@pytest.mark.forked
+def test_import_with_fluent_autolog_enables_tf_autologging(module_name, explicitly_import_keras):
     mlflow.autolog()
 
-    import tensorflow  # pylint: disable=unused-variable,unused-import,reimported
+    importlib.import_module(module_name)
 
     assert not autologging_is_disabled(mlflow.tensorflow.FLAVOR_NAME)
 
     # NB: In Tensorflow >= 2.6, we redirect keras autologging to tensorflow autologging
     # so the original keras autologging is disabled
-    if Version(tf.__version__) >= Version("2.6"):
-        import keras  # pylint: disable=unused-variable,unused-import
-
-        assert autologging_is_disabled(mlflow.keras.FLAVOR_NAME)
-
-
-@pytest.mark.large
-@pytest.mark.usefixtures("clear_tf_keras_imports")
-def test_import_tf_keras_with_fluent_autolog_enables_tf_autologging():
-    mlflow.autolog()
+    if _TF_GE_2_6:
+        if explicitly_import_keras:
+            importlib.import_module("keras")
 
-    import tensorflow.keras  # pylint: disable=unused-variable,unused-import
-
-    assert not autologging_is_disabled(mlflow.tensorflow.FLAVOR_NAME)
-
-    # NB: In Tensorflow >= 2.6, we redirect keras autologging to tensorflow autologging
-    # so the original keras autologging is disabled
-    if Version(tf.__version__) >= Version("2.6"):
-        # NB: For TF >= 2.6, import tensorflow.keras will trigger importing keras
         assert autologging_is_disabled(mlflow.keras.FLAVOR_NAME)
-
-
-@pytest.mark.large
-@pytest.mark.skipif(
-    Version(tf.__version__) < Version("2.6.0"),
-    reason=("TensorFlow autologging is not used for vanilla Keras models in Keras < 2.6.0"),
-)
-@pytest.mark.usefixtures("clear_tf_keras_imports")
-def test_import_keras_with_fluent_autolog_enables_tensorflow_autologging():
-    mlflow.autolog()
-
-    import keras  # pylint: disable=unused-variable,unused-import
-
-    assert not autologging_is_disabled(mlflow.tensorflow.FLAVOR_NAME)
-    assert autologging_is_disabled(mlflow.keras.FLAVOR_NAME)